@@ -2,14 +2,95 @@
 Database management class for the book library application.
 """
 
+import asyncio
+import functools
+import os
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
 from datetime import date
-from typing import List, Optional
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from sqlalchemy import Row, create_engine, event, func, insert, lambda_stmt, select, update
+from sqlalchemy.orm import sessionmaker, scoped_session, selectinload, raiseload, Session
+from sqlalchemy.pool import QueuePool
 
 from models import Base, Book, ReadingSession, Note, BookType, ReadingStatus, NoteType
 from utils.date_utils import parse_date_input
 
+# Rows per INSERT statement in the bulk helpers (keeps us well under
+# SQLite's bound-parameter limit)
+BULK_INSERT_BATCH_SIZE = 1000
+
+# Rows fetched per round-trip by the iter_* streaming methods
+STREAM_CHUNK_SIZE = 100
+
+# Maximum number of books kept in each per-book read cache
+BOOK_CACHE_SIZE = 256
+
+# Characters of content returned per note by get_note_previews
+NOTE_PREVIEW_CHARS = 100
+
+# Set STRICT_LOADING=1 (development/CI) to make accidental lazy loads of
+# relationships on returned books raise instead of silently querying
+STRICT_LOADING = bool(os.environ.get("STRICT_LOADING"))
+
+# Queued in place of a write to make the writer thread exit
+_STOP_WRITER = None
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tune each new SQLite connection as it is opened by the pool.
+    
+    WAL mode lets readers proceed while a write is in progress, and
+    synchronous=NORMAL avoids an fsync on every commit (still safe in WAL).
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")  # 64MB page cache
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256MB
+    cursor.close()
+
+
+def _parse_flex_date(date_string: Optional[str]) -> Optional[str]:
+    """SQL-callable wrapper around parse_date_input returning an ISO date string."""
+    parsed = parse_date_input(date_string)
+    return parsed.isoformat() if parsed else None
+
+
+def _register_sql_functions(dbapi_connection, connection_record):
+    """
+    Register Python helpers as SQL functions on each new connection.
+    
+    parse_flex_date(text) accepts the same flexible input as the UI, so a
+    query can filter with e.g. "WHERE start_date >= parse_flex_date(:since)".
+    It is marked deterministic so SQLite evaluates a constant argument once
+    per statement instead of once per row. Because "today" changes daily,
+    don't use it in indexes or generated columns.
+    """
+    dbapi_connection.create_function(
+        "parse_flex_date", 1, _parse_flex_date, deterministic=True
+    )
+
+
+def _write_operation(method):
+    """
+    Run a DatabaseManager method on the manager's writer thread.
+    
+    The calling thread blocks until the write has finished and receives
+    its return value (or exception). Calls made from the writer thread
+    itself run directly.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if threading.current_thread() is self._writer_thread:
+            return method(self, *args, **kwargs)
+        return self.submit_write(method, self, *args, **kwargs).result()
+    return wrapper
+
 
 class DatabaseManager:
     """
@@ -25,19 +106,202 @@ class DatabaseManager:
         """Initialize the database connection and create tables if needed."""
         # Create SQLite database engine
         # echo=True would show SQL queries in console (useful for learning)
-        self.engine = create_engine(f'sqlite:///{db_path}', echo=False)
+        # Connections are pooled and kept open for the lifetime of the app,
+        # so each operation checks one out instead of reopening the file.
+        self.engine = create_engine(
+            f'sqlite:///{db_path}',
+            echo=False,
+            poolclass=QueuePool,
+            pool_size=5,
+            pool_recycle=-1,
+            connect_args={"check_same_thread": False},
+        )
+        event.listen(self.engine, "connect", _set_sqlite_pragmas)
+        event.listen(self.engine, "connect", _register_sql_functions)
         
         # Create all tables if they don't exist
         Base.metadata.create_all(self.engine)
+        self._create_missing_indexes()
         
-        # Create a session factory
-        self.SessionLocal = sessionmaker(bind=self.engine)
+        # Create a thread-local session registry. expire_on_commit=False keeps
+        # loaded attributes usable on the objects we hand back to the UI.
+        self.SessionLocal = scoped_session(
+            sessionmaker(bind=self.engine, expire_on_commit=False)
+        )
+        
+        # Read caches, invalidated by the write operations below. The
+        # generation counter lets a read that raced with a write avoid
+        # caching what it fetched; the lock makes that check-and-store
+        # atomic with respect to invalidations on the writer thread.
+        self._author_cache: Optional[List[str]] = None
+        self._book_cache: "OrderedDict[int, Book]" = OrderedDict()
+        self._sessions_cache: "OrderedDict[int, List[ReadingSession]]" = OrderedDict()
+        self._notes_cache: "OrderedDict[int, List[Note]]" = OrderedDict()
+        self._note_previews_cache: "OrderedDict[int, List[Row]]" = OrderedDict()
+        self._cache_generation = 0
+        self._cache_lock = threading.Lock()
+        
+        # All writes go through one thread so SQLite only ever sees a
+        # single writer; reads use their own pooled connections.
+        self._write_queue: "queue.Queue" = queue.Queue()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="db-writer", daemon=True
+        )
+        self._writer_thread.start()
+    
+    def _create_missing_indexes(self) -> None:
+        """
+        Create any indexes declared on the models that the database lacks.
+        
+        create_all() skips tables that already exist, so databases created
+        by older versions would otherwise never get newly added indexes.
+        """
+        with self.engine.begin() as connection:
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(bind=connection, checkfirst=True)
+    
+    def close(self) -> None:
+        """
+        Finish all queued writes and stop the writer thread, let SQLite
+        refresh its query planner statistics, then close all pooled
+        connections. Call once when the application exits.
+        """
+        # The writer is a daemon thread, so without this, writes still in
+        # the queue (e.g. notes saved as a screen closes) could be cut off
+        # at interpreter exit
+        self._write_queue.put(_STOP_WRITER)
+        self._writer_thread.join()
+        
+        with self.engine.connect() as connection:
+            connection.exec_driver_sql("PRAGMA optimize")
+        self.SessionLocal.remove()
+        self.engine.dispose()
     
     def get_session(self) -> Session:
-        """Get a new database session. Remember to close it when done!"""
+        """
+        Get the database session for the current thread.
+        
+        Use it as a context manager; closing it returns the pooled
+        connection rather than closing the database file.
+        """
         return self.SessionLocal()
     
+    def _stream_session(self) -> Session:
+        """
+        Get a new session, separate from the thread's shared one.
+        
+        Used by the iter_* generators, which keep their session open while
+        the caller consumes results; other DatabaseManager calls made during
+        iteration would otherwise close it underneath them.
+        """
+        return self.SessionLocal.session_factory()
+    
+    def _stream(self, stmt, chunk: int) -> Iterator:
+        """Yield ORM objects for a statement in batches of `chunk` rows."""
+        with self._stream_session() as session:
+            yield from session.scalars(
+                stmt, execution_options={"yield_per": chunk}
+            )
+    
+    def _stream_rows(self, stmt, chunk: int) -> Iterator[Row]:
+        """Yield Row tuples for a column statement in batches of `chunk` rows."""
+        with self._stream_session() as session:
+            yield from session.execute(
+                stmt, execution_options={"yield_per": chunk}
+            )
+    
+    def _writer_loop(self) -> None:
+        """Execute queued write operations one at a time until stopped."""
+        while True:
+            item = self._write_queue.get()
+            if item is _STOP_WRITER:
+                return
+            func, args, kwargs, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(*args, **kwargs))
+            except BaseException as exc:
+                future.set_exception(exc)
+    
+    def submit_write(self, func: Callable, *args, **kwargs) -> Future:
+        """
+        Queue a write operation without waiting for it.
+        
+        Returns a concurrent.futures.Future; async code can await it with
+        asyncio.wrap_future(). For example:
+            await asyncio.wrap_future(db.submit_write(db.add_note, book_id, ...))
+        """
+        if not self._writer_thread.is_alive():
+            raise RuntimeError("DatabaseManager has been closed")
+        future = Future()
+        self._write_queue.put((func, args, kwargs, future))
+        return future
+    
+    async def run_write(self, func: Callable, *args, **kwargs):
+        """
+        Run a write operation from async code (e.g. a Textual worker) and
+        return its result, without blocking the event loop while it waits
+        for the writer thread.
+        
+        Cancelling the caller (Textual cancels a screen's workers when it
+        is dismissed, and all workers at exit) only stops the wait: the
+        write itself still runs, so a confirmed change is never dropped.
+        The caller's code after the await is skipped as usual.
+        """
+        return await asyncio.shield(
+            asyncio.wrap_future(self.submit_write(func, *args, **kwargs))
+        )
+    
+    @staticmethod
+    def _cache_lookup(cache: OrderedDict, key):
+        """Return a cached value and mark it recently used, or None on a miss."""
+        try:
+            cache.move_to_end(key)
+            return cache[key]
+        except KeyError:
+            return None
+    
+    def _cache_store(self, cache: OrderedDict, key, value, generation: int) -> None:
+        """
+        Cache a value read at `generation`, evicting the least recently used
+        entry when full. Skipped if a write invalidated caches since the read.
+        """
+        with self._cache_lock:
+            if generation != self._cache_generation:
+                return
+            cache[key] = value
+            if len(cache) > BOOK_CACHE_SIZE:
+                cache.popitem(last=False)
+    
+    def _invalidate_book(self, book_id: int) -> None:
+        """Drop a book from the read cache after it has been modified."""
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._book_cache.pop(book_id, None)
+    
+    def _invalidate_sessions(self, book_id: int) -> None:
+        """Drop a book's cached reading sessions after they changed."""
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._sessions_cache.pop(book_id, None)
+    
+    def _invalidate_notes(self, book_id: int) -> None:
+        """Drop a book's cached notes after they changed."""
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._notes_cache.pop(book_id, None)
+            self._note_previews_cache.pop(book_id, None)
+    
+    def _invalidate_authors(self) -> None:
+        """Drop the cached author list after books were added or removed."""
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._author_cache = None
+    
     # Book operations
+    @_write_operation
     def add_book(self, title: str, author: str, book_type: BookType, 
                  isbn: str = None, publisher: str = None, 
                  publication_year: int = None, pages: int = None) -> Book:
@@ -55,49 +319,190 @@ class DatabaseManager:
             session.add(book)
             session.commit()
             session.refresh(book)  # Get the assigned ID
-            return book
+        self._invalidate_authors()
+        return book
+    
+    @_write_operation
+    def add_books_bulk(self, rows: List[Dict]) -> List[int]:
+        """
+        Add many books in a single transaction.
+        
+        Args:
+            rows: Dictionaries with the same keys as add_book's arguments
+            
+        Returns:
+            The IDs assigned to the new books, in input order
+        """
+        ids = self._bulk_insert(Book, rows)
+        self._invalidate_authors()
+        return ids
+    
+    def get_all_books(self, include_related: bool = False) -> List[Book]:
+        """
+        Get all books in the library.
+        
+        Args:
+            include_related: Also load each book's reading sessions and notes
+                (two extra queries in total, rather than two per book). The
+                returned books are detached, so collections that weren't
+                loaded here can't be accessed later.
+        """
+        with self.get_session() as session:
+            query = session.query(Book)
+            if include_related:
+                query = query.options(
+                    selectinload(Book.reading_sessions),
+                    selectinload(Book.notes)
+                )
+            if STRICT_LOADING:
+                query = query.options(raiseload("*"))
+            return query.order_by(Book.title).all()
     
-    def get_all_books(self) -> List[Book]:
-        """Get all books in the library."""
+    def list_books_summary(self) -> List[Row]:
+        """
+        Get the columns shown in the main book list, ordered by title.
+        
+        Returns plain Row tuples (id, title, author, book_type, status,
+        added_date) instead of full Book objects, so no ORM instances or
+        relationship loaders are involved. added_date is the day as an ISO
+        "YYYY-MM-DD" string, formatted by SQLite. Use get_book_by_id for
+        details.
+        """
         with self.get_session() as session:
-            return session.query(Book).order_by(Book.title).all()
+            return session.execute(self._books_summary_stmt()).all()
+    
+    def iter_books_summary(self, chunk: int = STREAM_CHUNK_SIZE) -> Iterator[Row]:
+        """Stream the rows returned by list_books_summary in batches."""
+        return self._stream_rows(self._books_summary_stmt(), chunk)
+    
+    @staticmethod
+    def _books_summary_stmt():
+        """Select the main book list columns, ordered by title."""
+        return lambda_stmt(lambda: select(
+            Book.id, Book.title, Book.author,
+            Book.book_type, Book.status,
+            # SQLite's date() yields the display string directly, so no
+            # datetime objects are built just to be formatted again
+            func.date(Book.added_date).label("added_date")
+        ).order_by(Book.title))
+    
+    def iter_books(self, chunk: int = STREAM_CHUNK_SIZE) -> Iterator[Book]:
+        """Stream all books ordered by title without loading them all at once."""
+        return self._stream(
+            lambda_stmt(lambda: select(Book).order_by(Book.title)), chunk
+        )
     
     def get_book_by_id(self, book_id: int) -> Optional[Book]:
-        """Get a specific book by its ID."""
+        """Get a specific book by its ID (cached until the book changes)."""
+        book = self._cache_lookup(self._book_cache, book_id)
+        if book is not None:
+            return book
+        
+        generation = self._cache_generation
         with self.get_session() as session:
-            return session.query(Book).filter(Book.id == book_id).first()
+            # Primary-key lookup: checks the identity map before issuing SQL
+            book = session.get(
+                Book, book_id,
+                options=[raiseload("*")] if STRICT_LOADING else None
+            )
+        
+        if book is not None:
+            self._cache_store(self._book_cache, book_id, book, generation)
+        return book
     
+    def get_book_details(
+        self, book_id: int
+    ) -> Optional[Tuple[Book, List[ReadingSession], List[Row]]]:
+        """
+        Get a book together with its reading sessions and note previews.
+        
+        Served from the read caches when all three are cached. Otherwise the
+        book (with its sessions via selectinload) and the note previews are
+        loaded through one session, and the caches are filled from the result.
+        
+        Returns:
+            (book, sessions, note_previews) ordered as get_reading_sessions and
+            get_note_previews order them, or None if the book doesn't exist
+        """
+        book = self._cache_lookup(self._book_cache, book_id)
+        sessions = self._cache_lookup(self._sessions_cache, book_id)
+        previews = self._cache_lookup(self._note_previews_cache, book_id)
+        if book is not None and sessions is not None and previews is not None:
+            return book, sessions, previews
+        
+        generation = self._cache_generation
+        options = [selectinload(Book.reading_sessions)]
+        if STRICT_LOADING:
+            options.append(raiseload("*"))
+        with self.get_session() as session:
+            book = session.get(Book, book_id, options=options)
+            if book is None:
+                return None
+            previews = session.execute(self._note_previews_stmt(book_id)).all()
+        
+        sessions = list(book.reading_sessions)
+        self._cache_store(self._book_cache, book_id, book, generation)
+        self._cache_store(self._sessions_cache, book_id, sessions, generation)
+        self._cache_store(self._note_previews_cache, book_id, previews, generation)
+        return book, sessions, previews
+    
+    @_write_operation
     def update_book_status(self, book_id: int, status: ReadingStatus):
         """Update the reading status of a book."""
         with self.get_session() as session:
-            book = session.query(Book).filter(Book.id == book_id).first()
-            if book:
-                book.status = status
-                session.commit()
+            # Single UPDATE statement - no need to load the book first
+            session.execute(
+                update(Book).where(Book.id == book_id).values(status=status)
+            )
+            session.commit()
+        self._invalidate_book(book_id)
     
+    @_write_operation
     def delete_book(self, book_id: int) -> bool:
         """Delete a book and all its associated data."""
         with self.get_session() as session:
-            book = session.query(Book).filter(Book.id == book_id).first()
-            if book:
-                session.delete(book)
-                session.commit()
-                return True
-            return False
+            book = session.get(Book, book_id)
+            if not book:
+                return False
+            session.delete(book)
+            session.commit()
+        self._invalidate_book(book_id)
+        self._invalidate_sessions(book_id)
+        self._invalidate_notes(book_id)
+        self._invalidate_authors()
+        return True
     
     # Author operations for autocomplete
     def get_unique_authors(self) -> List[str]:
-        """Get all unique authors from the database."""
-        with self.get_session() as session:
-            authors = session.query(Book.author).distinct().order_by(Book.author).all()
-            return [author[0] for author in authors]
+        """
+        Get all unique authors from the database.
+        
+        The list is cached until a book is added or deleted; callers
+        must not modify it.
+        """
+        authors = self._author_cache
+        if authors is None:
+            generation = self._cache_generation
+            with self.get_session() as session:
+                # Answered from the ix_books_author index alone; scalars()
+                # yields the strings directly without row tuples
+                authors = session.scalars(
+                    select(Book.author).distinct().order_by(Book.author)
+                ).all()
+            with self._cache_lock:
+                if generation == self._cache_generation:
+                    self._author_cache = authors
+        return authors
     
     def get_books_by_author(self, author: str) -> List[Book]:
         """Get all books by a specific author."""
         with self.get_session() as session:
-            return session.query(Book).filter(Book.author == author).all()
+            return session.scalars(
+                lambda_stmt(lambda: select(Book).where(Book.author == author))
+            ).all()
     
     # Reading session operations
+    @_write_operation
     def start_reading_session(self, book_id: int, start_date_str: str = None) -> ReadingSession:
         """
         Start a new reading session for a book.
@@ -115,28 +520,34 @@ class DatabaseManager:
             start_date = date.today()
             
         with self.get_session() as session:
-            # End any current reading session for this book
-            current_session = session.query(ReadingSession).filter(
-                ReadingSession.book_id == book_id,
-                ReadingSession.end_date.is_(None)
-            ).first()
-            
-            if current_session:
-                current_session.end_date = start_date
-            
-            # Create new session
-            new_session = ReadingSession(book_id=book_id, start_date=start_date)
-            session.add(new_session)
-            
-            # Update book status
-            book = session.query(Book).filter(Book.id == book_id).first()
-            if book:
-                book.status = ReadingStatus.READING
+            # Everything below goes out in one transaction; the new session
+            # row is only flushed at commit time
+            with session.no_autoflush:
+                # End any current reading session for this book
+                session.execute(
+                    update(ReadingSession)
+                    .where(*self._open_session_criteria(book_id))
+                    .values(end_date=start_date)
+                )
+                
+                # Create new session
+                new_session = ReadingSession(book_id=book_id, start_date=start_date)
+                session.add(new_session)
+                
+                # Update book status
+                session.execute(
+                    update(Book)
+                    .where(Book.id == book_id)
+                    .values(status=ReadingStatus.READING)
+                )
             
             session.commit()
             session.refresh(new_session)
-            return new_session
+        self._invalidate_book(book_id)
+        self._invalidate_sessions(book_id)
+        return new_session
     
+    @_write_operation
     def end_reading_session(self, book_id: int, end_date_str: str = None, 
                            session_notes: str = None, completed: bool = False):
         """
@@ -156,33 +567,68 @@ class DatabaseManager:
         else:
             end_date = date.today()
             
+        values = {'end_date': end_date}
+        if session_notes:
+            values['session_notes'] = session_notes
+        
         with self.get_session() as session:
-            current_session = session.query(ReadingSession).filter(
-                ReadingSession.book_id == book_id,
-                ReadingSession.end_date.is_(None)
-            ).first()
+            # Close the open session directly with an UPDATE
+            result = session.execute(
+                update(ReadingSession)
+                .where(*self._open_session_criteria(book_id))
+                .values(**values)
+            )
             
-            if current_session:
-                current_session.end_date = end_date
-                if session_notes:
-                    current_session.session_notes = session_notes
-                
-                # Update book status if completed
-                if completed:
-                    book = session.query(Book).filter(Book.id == book_id).first()
-                    if book:
-                        book.status = ReadingStatus.COMPLETED
-                
-                session.commit()
+            # Update book status if completed (only when a session was open)
+            if result.rowcount and completed:
+                session.execute(
+                    update(Book)
+                    .where(Book.id == book_id)
+                    .values(status=ReadingStatus.COMPLETED)
+                )
+            
+            session.commit()
+        self._invalidate_book(book_id)
+        self._invalidate_sessions(book_id)
+    
+    @staticmethod
+    def _open_session_criteria(book_id: int) -> tuple:
+        """
+        WHERE criteria for a book's open (not yet ended) reading session.
+        
+        Shared by every open-session query so they all match the
+        ix_reading_sessions_open partial index.
+        """
+        return (ReadingSession.book_id == book_id, ReadingSession.end_date.is_(None))
     
     def get_reading_sessions(self, book_id: int) -> List[ReadingSession]:
-        """Get all reading sessions for a book."""
-        with self.get_session() as session:
-            return session.query(ReadingSession).filter(
-                ReadingSession.book_id == book_id
-            ).order_by(ReadingSession.start_date.desc()).all()
+        """
+        Get all reading sessions for a book, most recent first.
+        
+        The list is cached until the book's sessions change; callers
+        must not modify it.
+        """
+        sessions = self._cache_lookup(self._sessions_cache, book_id)
+        if sessions is None:
+            generation = self._cache_generation
+            sessions = list(self.iter_reading_sessions(book_id))
+            self._cache_store(self._sessions_cache, book_id, sessions, generation)
+        return sessions
+    
+    def iter_reading_sessions(self, book_id: int,
+                              chunk: int = STREAM_CHUNK_SIZE) -> Iterator[ReadingSession]:
+        """Stream a book's reading sessions, most recent first."""
+        # lambda_stmt caches the constructed statement; book_id becomes a
+        # bound parameter rather than part of the cache key
+        return self._stream(
+            lambda_stmt(lambda: select(ReadingSession)
+                        .where(ReadingSession.book_id == book_id)
+                        .order_by(ReadingSession.start_date.desc())),
+            chunk
+        )
     
     # Note operations
+    @_write_operation
     def add_note(self, book_id: int, note_type: NoteType, content: str,
                  title: str = None, page_number: int = None) -> Note:
         """Add a note to a book."""
@@ -197,21 +643,101 @@ class DatabaseManager:
             session.add(note)
             session.commit()
             session.refresh(note)
-            return note
+        self._invalidate_notes(book_id)
+        return note
+    
+    @_write_operation
+    def add_notes_bulk(self, rows: List[Dict]) -> List[int]:
+        """
+        Add many notes in a single transaction.
+        
+        Args:
+            rows: Dictionaries with the same keys as add_note's arguments
+            
+        Returns:
+            The IDs assigned to the new notes, in input order
+        """
+        ids = self._bulk_insert(Note, rows)
+        for book_id in {row['book_id'] for row in rows}:
+            self._invalidate_notes(book_id)
+        return ids
     
     def get_notes_for_book(self, book_id: int) -> List[Note]:
-        """Get all notes for a specific book."""
-        with self.get_session() as session:
-            return session.query(Note).filter(
-                Note.book_id == book_id
-            ).order_by(Note.created_date.desc()).all()
+        """
+        Get all notes for a specific book, newest first.
+        
+        The list is cached until the book's notes change; callers
+        must not modify it.
+        """
+        notes = self._cache_lookup(self._notes_cache, book_id)
+        if notes is None:
+            generation = self._cache_generation
+            notes = list(self.iter_notes_for_book(book_id))
+            self._cache_store(self._notes_cache, book_id, notes, generation)
+        return notes
     
+    def get_note_previews(self, book_id: int) -> List[Row]:
+        """
+        Get lightweight rows for listing a book's notes, newest first.
+        
+        Each Row has (id, note_type, title, preview, page_number), where
+        preview is the first NOTE_PREVIEW_CHARS + 1 characters of the content
+        - one extra so callers can tell whether the note was cut short. Full
+        note contents are never transferred. Cached until the notes change.
+        """
+        previews = self._cache_lookup(self._note_previews_cache, book_id)
+        if previews is None:
+            generation = self._cache_generation
+            with self.get_session() as session:
+                previews = session.execute(self._note_previews_stmt(book_id)).all()
+            self._cache_store(self._note_previews_cache, book_id, previews, generation)
+        return previews
+    
+    @staticmethod
+    def _note_previews_stmt(book_id: int):
+        """Select the note preview columns for a book, newest first."""
+        return lambda_stmt(lambda: select(
+            Note.id, Note.note_type, Note.title,
+            func.substr(Note.content, 1, NOTE_PREVIEW_CHARS + 1).label("preview"),
+            Note.page_number
+        ).where(Note.book_id == book_id).order_by(Note.created_date.desc()))
+    
+    def iter_notes_for_book(self, book_id: int,
+                            chunk: int = STREAM_CHUNK_SIZE) -> Iterator[Note]:
+        """Stream a book's notes, newest first."""
+        return self._stream(
+            lambda_stmt(lambda: select(Note)
+                        .where(Note.book_id == book_id)
+                        .order_by(Note.created_date.desc())),
+            chunk
+        )
+    
+    @_write_operation
     def delete_note(self, note_id: int) -> bool:
         """Delete a specific note."""
         with self.get_session() as session:
-            note = session.query(Note).filter(Note.id == note_id).first()
-            if note:
-                session.delete(note)
-                session.commit()
-                return True
-            return False
\ No newline at end of file
+            note = session.get(Note, note_id)
+            if not note:
+                return False
+            book_id = note.book_id
+            session.delete(note)
+            session.commit()
+        self._invalidate_notes(book_id)
+        return True
+    
+    def _bulk_insert(self, model, rows: List[Dict]) -> List[int]:
+        """Insert rows for a model in batches and return the new IDs."""
+        ids = []
+        if not rows:
+            return ids
+        
+        with self.get_session() as session:
+            for start in range(0, len(rows), BULK_INSERT_BATCH_SIZE):
+                batch = rows[start:start + BULK_INSERT_BATCH_SIZE]
+                result = session.scalars(
+                    insert(model).returning(model.id, sort_by_parameter_order=True),
+                    batch
+                )
+                ids.extend(result.all())
+            session.commit()
+        return ids
\ No newline at end of file
@@ -3,7 +3,10 @@ Database models for the book library application.
 """
 
 from .base import Base
-from .enums import BookType, ReadingStatus, NoteType
+from .enums import (
+    BookType, ReadingStatus, NoteType,
+    BOOK_TYPE_VALUE, READING_STATUS_VALUE, NOTE_TYPE_VALUE
+)
 from .book import Book
 from .reading_session import ReadingSession
 from .note import Note
@@ -13,6 +16,9 @@ __all__ = [
     'BookType',
     'ReadingStatus', 
     'NoteType',
+    'BOOK_TYPE_VALUE',
+    'READING_STATUS_VALUE',
+    'NOTE_TYPE_VALUE',
     'Book',
     'ReadingSession',
     'Note'
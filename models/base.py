@@ -2,7 +2,19 @@
 SQLAlchemy base configuration for the book library application.
 """
 
+from datetime import datetime, timezone
+
 from sqlalchemy.orm import declarative_base
 
 # Create the base class for our database models
-Base = declarative_base()
\ No newline at end of file
+Base = declarative_base()
+
+
+def utcnow() -> datetime:
+    """
+    Current UTC time as a naive datetime, for column defaults.
+    
+    Matches what SQLite's CURRENT_TIMESTAMP stored previously, but is
+    computed in Python so INSERTs don't need a SQL function per row.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
\ No newline at end of file
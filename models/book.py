@@ -2,11 +2,10 @@
 Book model for the library application.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
 
-from .base import Base
+from .base import Base, utcnow
 from .enums import BookType, ReadingStatus
 
 
@@ -21,29 +20,51 @@ class Book(Base):
     - Timestamps for when added/modified
     """
     __tablename__ = 'books'
+    __table_args__ = (
+        # Covering index for the main book list: holds every column it
+        # shows, in title order, so listing never touches the table itself
+        Index(
+            'ix_books_list',
+            'title', 'author', 'book_type', 'status', 'added_date'
+        ),
+    )
     
     # Primary key
     id = Column(Integer, primary_key=True, autoincrement=True)
     
     # Basic book information
     title = Column(String(255), nullable=False)
-    author = Column(String(255), nullable=False)
+    author = Column(String(255), nullable=False, index=True)
     isbn = Column(String(20), nullable=True, unique=True)
     publisher = Column(String(255), nullable=True)
     publication_year = Column(Integer, nullable=True)
     pages = Column(Integer, nullable=True)
     
-    # Book type and status
-    book_type = Column(Enum(BookType), nullable=False, default=BookType.PHYSICAL)
-    status = Column(Enum(ReadingStatus), nullable=False, default=ReadingStatus.TO_READ)
+    # Book type and status - stored as plain VARCHAR (SQLite has no native
+    # enum type) with a CHECK constraint on the allowed member names
+    book_type = Column(
+        Enum(BookType, native_enum=False, create_constraint=True, length=16),
+        nullable=False, default=BookType.PHYSICAL
+    )
+    status = Column(
+        Enum(ReadingStatus, native_enum=False, create_constraint=True, length=16),
+        nullable=False, default=ReadingStatus.TO_READ
+    )
     
     # Metadata
-    added_date = Column(DateTime, default=func.now())
-    last_modified = Column(DateTime, default=func.now(), onupdate=func.now())
+    added_date = Column(DateTime, default=utcnow)
+    last_modified = Column(DateTime, default=utcnow, onupdate=utcnow)
     
-    # Relationships - one book can have many reading sessions and notes
-    reading_sessions = relationship("ReadingSession", back_populates="book", cascade="all, delete-orphan")
-    notes = relationship("Note", back_populates="book", cascade="all, delete-orphan")
+    # Relationships - one book can have many reading sessions and notes,
+    # loaded in the same order the UI lists them (most recent first)
+    reading_sessions = relationship(
+        "ReadingSession", back_populates="book", cascade="all, delete-orphan",
+        order_by="ReadingSession.start_date.desc()"
+    )
+    notes = relationship(
+        "Note", back_populates="book", cascade="all, delete-orphan",
+        order_by="Note.created_date.desc()"
+    )
     
     def __repr__(self):
         return f"<Book(title='{self.title}', author='{self.author}', status='{self.status.value}')>"
\ No newline at end of file
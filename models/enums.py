@@ -1,18 +1,21 @@
 """
 Enumerations used throughout the book library application.
+
+The enums mix in ``str`` so members compare equal to their display
+values (e.g. ``BookType.PHYSICAL == "Physical"``).
 """
 
 import enum
 
 
-class BookType(enum.Enum):
+class BookType(str, enum.Enum):
     """Enumeration for different types of books"""
     PHYSICAL = "Physical"
     EBOOK = "E-book"
     AUDIOBOOK = "Audiobook"
 
 
-class ReadingStatus(enum.Enum):
+class ReadingStatus(str, enum.Enum):
     """Enumeration for reading status"""
     TO_READ = "To Read"
     READING = "Currently Reading"
@@ -20,9 +23,16 @@ class ReadingStatus(enum.Enum):
     ABANDONED = "Abandoned"
 
 
-class NoteType(enum.Enum):
+class NoteType(str, enum.Enum):
     """Different types of notes that can be attached to books"""
     REVIEW = "Review"
     HIGHLIGHT = "Highlight"
     THOUGHT = "Thought"
-    QUOTE = "Quote"
\ No newline at end of file
+    QUOTE = "Quote"
+
+
+# Display value for each member, for hot rendering loops where a dict lookup
+# is cheaper than going through the ``.value`` descriptor
+BOOK_TYPE_VALUE = {member: member.value for member in BookType}
+READING_STATUS_VALUE = {member: member.value for member in ReadingStatus}
+NOTE_TYPE_VALUE = {member: member.value for member in NoteType}
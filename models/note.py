@@ -2,11 +2,10 @@
 Note model for storing reviews, thoughts, highlights, and quotes.
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
 
-from .base import Base
+from .base import Base, utcnow
 from .enums import NoteType
 
 
@@ -21,6 +20,10 @@ class Note(Base):
     - Quotes: Memorable quotes from the book
     """
     __tablename__ = 'notes'
+    __table_args__ = (
+        # Serves per-book note lists ordered by creation date
+        Index('ix_notes_book_created', 'book_id', 'created_date'),
+    )
     
     # Primary key
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -35,11 +38,13 @@ class Note(Base):
     page_number = Column(Integer, nullable=True)  # For highlights/quotes
     
     # Metadata
-    created_date = Column(DateTime, default=func.now())
-    last_modified = Column(DateTime, default=func.now(), onupdate=func.now())
+    created_date = Column(DateTime, default=utcnow)
+    last_modified = Column(DateTime, default=utcnow, onupdate=utcnow)
     
     # Relationship back to book
     book = relationship("Book", back_populates="notes")
     
     def __repr__(self):
-        return f"<Note(book='{self.book.title}', type='{self.note_type.value}', title='{self.title}')>"
\ No newline at end of file
+        # Uses the foreign key rather than self.book, so printing notes never
+        # lazy-loads a book per note (or fails on detached instances)
+        return f"<Note(book_id={self.book_id}, type='{self.note_type.value}', title='{self.title}')>"
\ No newline at end of file
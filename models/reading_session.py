@@ -3,11 +3,10 @@ Reading session model for tracking when books are read.
 """
 
 from datetime import date
-from sqlalchemy import Column, Integer, Date, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Date, Text, DateTime, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
 
-from .base import Base
+from .base import Base, utcnow
 
 
 class ReadingSession(Base):
@@ -19,6 +18,16 @@ class ReadingSession(Base):
     overwhelming to track.
     """
     __tablename__ = 'reading_sessions'
+    __table_args__ = (
+        # Serves the per-book session list, already in start_date order
+        Index('ix_reading_sessions_book_start', 'book_id', 'start_date'),
+        # Partial index holding only open sessions - tiny, and exactly what
+        # the "current session for this book" lookup needs
+        Index(
+            'ix_reading_sessions_open', 'book_id',
+            sqlite_where=text('end_date IS NULL')
+        ),
+    )
     
     # Primary key
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -34,11 +43,13 @@ class ReadingSession(Base):
     session_notes = Column(Text, nullable=True)
     
     # Metadata
-    created_date = Column(DateTime, default=func.now())
+    created_date = Column(DateTime, default=utcnow)
     
     # Relationship back to book
     book = relationship("Book", back_populates="reading_sessions")
     
     def __repr__(self):
-        end_str = self.end_date.strftime('%Y-%m-%d') if self.end_date else "ongoing"
-        return f"<ReadingSession(book='{self.book.title}', start='{self.start_date}', end='{end_str}')>"
\ No newline at end of file
+        # Uses the foreign key rather than self.book, so printing sessions
+        # never lazy-loads a book per session (or fails on detached instances)
+        end_str = self.end_date.isoformat() if self.end_date else "ongoing"
+        return f"<ReadingSession(book_id={self.book_id}, start='{self.start_date}', end='{end_str}')>"
\ No newline at end of file
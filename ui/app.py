@@ -2,14 +2,16 @@
 Main application class for the book library tracker.
 """
 
+from textual import work
+from textual.worker import get_current_worker
 from textual.app import App, ComposeResult
 from textual.containers import Container
 from textual.widgets import DataTable, Header, Footer
 from textual.binding import Binding
 
 from database import DatabaseManager
-from .screens import AddBookScreen, BookDetailScreen
-from .styles import APP_CSS
+from models import BOOK_TYPE_VALUE, READING_STATUS_VALUE
+from .styles import APP_CSS_PATH
 
 
 class LibraryApp(App):
@@ -22,7 +24,7 @@ class LibraryApp(App):
     """
     
     # CSS styling for the application
-    CSS = APP_CSS
+    CSS_PATH = APP_CSS_PATH
     
     # Key bindings for the main screen
     BINDINGS = [
@@ -31,19 +33,29 @@ class LibraryApp(App):
         Binding("r", "refresh", "Refresh"),
     ]
     
+    # Minimum seconds between books table refreshes; requests made in the
+    # meantime are folded into the pending one
+    REFRESH_INTERVAL = 1 / 30
+    
     def __init__(self):
         super().__init__()
         self.db_manager = DatabaseManager()
+        # Cell values currently shown for each book ID, used to diff refreshes
+        self._rendered_rows = {}
+        self._refresh_pending = False
     
     def compose(self) -> ComposeResult:
         """Compose the main application layout."""
         yield Header()
         
         with Container():
-            # Create a data table to display books
-            table = DataTable(id="books-table", cursor_type="row")
-            table.add_columns("Title", "Author", "Type", "Status", "Added")
-            yield table
+            # Create a data table to display books, keeping a reference
+            # since it's used on every refresh
+            self._books_table = DataTable(id="books-table", cursor_type="row")
+            self._column_keys = self._books_table.add_columns(
+                "Title", "Author", "Type", "Status", "Added"
+            )
+            yield self._books_table
         
         yield Footer()
     
@@ -53,26 +65,94 @@ class LibraryApp(App):
         self.sub_title = "Track your reading journey with Python & Textual"
         self.refresh_books_table()
         # Auto-focus the table for keyboard navigation
-        self.query_one("#books-table").focus()
+        self._books_table.focus()
+        self.prefetch_authors()
+    
+    @work(exclusive=True, thread=True, group="prefetch")
+    def prefetch_authors(self) -> None:
+        """
+        Warm the database manager's author cache in the background, so the
+        add book dialog's autocomplete list is ready without a query when
+        the user opens it.
+        """
+        self.db_manager.get_unique_authors()
+    
+    def request_books_refresh(self) -> None:
+        """
+        Mark the books table as stale.
+        
+        Any number of requests within REFRESH_INTERVAL result in a single
+        refresh, so bursts of changes don't rebuild the table repeatedly.
+        """
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.set_timer(self.REFRESH_INTERVAL, self._run_pending_refresh)
     
+    def _run_pending_refresh(self) -> None:
+        """Perform the refresh scheduled by request_books_refresh."""
+        self._refresh_pending = False
+        self.refresh_books_table()
+    
+    @work(exclusive=True, thread=True, group="books-table")
     def refresh_books_table(self) -> None:
-        """Refresh the books table with current data."""
-        table = self.query_one("#books-table")
-        table.clear()
+        """
+        Refresh the books table with current data.
         
-        books = self.db_manager.get_all_books()
-        for book in books:
-            table.add_row(
-                book.title,
-                book.author,
-                book.book_type.value,
-                book.status.value,
-                book.added_date.strftime('%Y-%m-%d'),
-                key=str(book.id)  # Store book ID as row key for later reference
+        The rows are read in a background thread and handed to
+        _apply_books_rows on the UI thread. Starting a new refresh
+        supersedes any one still in progress.
+        """
+        new_rows = {
+            book_id: (
+                title,
+                author,
+                BOOK_TYPE_VALUE[book_type],
+                READING_STATUS_VALUE[status],
+                added_date,
             )
+            for book_id, title, author, book_type, status, added_date
+            in self.db_manager.iter_books_summary()
+        }
+        if not get_current_worker().is_cancelled:
+            self.call_from_thread(self._apply_books_rows, new_rows)
+    
+    def _apply_books_rows(self, new_rows: dict) -> None:
+        """
+        Show freshly read rows in the books table (runs on the UI thread).
+        
+        Only rows that were added, removed or changed since the last refresh
+        are touched, so an unchanged library costs no table updates.
+        """
+        table = self._books_table
+        old_rows = self._rendered_rows
+        needs_sort = False
+        
+        for book_id in old_rows.keys() - new_rows.keys():
+            table.remove_row(str(book_id))
+        
+        for book_id, values in new_rows.items():
+            old_values = old_rows.get(book_id)
+            if old_values is None:
+                # Store book ID as row key for later reference
+                table.add_row(*values, key=str(book_id))
+                needs_sort = True
+            elif old_values != values:
+                for column_key, old, new in zip(self._column_keys, old_values, values):
+                    if old != new:
+                        table.update_cell(str(book_id), column_key, new)
+                needs_sort = needs_sort or old_values[0] != values[0]
+        
+        # New rows are appended at the bottom; restore title order
+        if needs_sort:
+            table.sort(self._column_keys[0])
+        
+        self._rendered_rows = new_rows
     
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection in the books table."""
+        # Screens are imported when first shown to keep startup fast
+        from .screens import BookDetailScreen
+        
         # Get the book ID from the row key and show book details
         book_id = int(event.row_key.value)
         detail_screen = BookDetailScreen(book_id, self.db_manager)
@@ -80,34 +160,43 @@ class LibraryApp(App):
     
     def action_add_book(self) -> None:
         """Show the add book dialog with author autocomplete."""
+        from .screens import AddBookScreen
+        
         def handle_add_book_result(book_data):
             """Callback function to handle the result from add book dialog."""
             if book_data:  # User didn't cancel
-                try:
-                    # Remove any extra fields that aren't in the database model
-                    # (like genre and description which were added for the scrolling demo)
-                    db_fields = {
-                        'title', 'author', 'book_type', 'isbn', 
-                        'publisher', 'publication_year', 'pages'
-                    }
-                    filtered_data = {k: v for k, v in book_data.items() if k in db_fields}
-                    
-                    self.db_manager.add_book(**filtered_data)
-                    self.refresh_books_table()
-                except Exception as e:
-                    # In a real app, you'd show a proper error dialog
-                    self.bell()  # Make a sound to indicate error
+                # Only the 'db' fields are stored; the extras (genre and
+                # description) were added for the scrolling demo
+                self.add_book(book_data['db'])
         
-        # Get existing authors for autocomplete
+        # Get existing authors for autocomplete (normally already cached by
+        # prefetch_authors)
         existing_authors = self.db_manager.get_unique_authors()
         
         # Push the modal screen and set up the callback
         add_book_screen = AddBookScreen(existing_authors)
         self.push_screen(add_book_screen, handle_add_book_result)
     
+    @work(group="db-write")
+    async def add_book(self, fields: dict) -> None:
+        """Save a new book without blocking the UI, then refresh the table."""
+        try:
+            await self.db_manager.run_write(self.db_manager.add_book, **fields)
+        except Exception as e:
+            # In a real app, you'd show a proper error dialog
+            self.bell()  # Make a sound to indicate error
+            return
+        self.request_books_refresh()
+        # Adding a book invalidated the author cache; refill it
+        self.prefetch_authors()
+    
     def action_refresh(self) -> None:
         """Refresh the books table."""
-        self.refresh_books_table()
+        self.request_books_refresh()
+    
+    def on_unmount(self) -> None:
+        """Close the database when the application shuts down."""
+        self.db_manager.close()
     
     def action_quit(self) -> None:
         """Quit the application."""
@@ -2,7 +2,7 @@
 Modal screen for adding a new book with author autocomplete.
 """
 
-from typing import List
+from typing import List, Optional
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical, Horizontal
 from textual.widgets import Button, Input, TextArea, Static, Select, Label
@@ -12,6 +12,17 @@ from textual.binding import Binding
 from models import BookType
 from ui.widgets import AutocompleteInput
 
+# Options for the book type dropdown, built once at import rather than per open
+_BOOK_TYPE_OPTIONS = tuple((book_type.value, book_type) for book_type in BookType)
+
+
+def _to_int(text: str) -> Optional[int]:
+    """Convert text to an int, returning None if it isn't a whole number."""
+    try:
+        return int(text)
+    except ValueError:
+        return None
+
 
 class AddBookScreen(ModalScreen):
     """
@@ -26,6 +37,17 @@ class AddBookScreen(ModalScreen):
         Binding("escape", "cancel", "Cancel", show=False),
     ]
     
+    # (form key, label, placeholder) for the optional single-line inputs,
+    # in display order. Each input's ID is "<form key>-input".
+    _OPTIONAL_INPUT_FIELDS = (
+        ('isbn', "ISBN (optional):", "Enter ISBN"),
+        ('publisher', "Publisher (optional):", "Enter publisher"),
+        ('year', "Publication Year (optional):", "Enter year"),
+        ('pages', "Pages (optional):", "Enter page count"),
+        # Additional fields that might require scrolling
+        ('genre', "Genre (optional):", "Enter genre"),
+    )
+    
     def __init__(self, existing_authors: List[str] = None):
         """
         Initialize the add book screen.
@@ -35,58 +57,70 @@ class AddBookScreen(ModalScreen):
         """
         super().__init__()
         self.existing_authors = existing_authors or []
+        # Button ID -> handler, so a press is one dict lookup
+        self._button_handlers = {
+            "cancel-btn": self.action_cancel,  # Returns None to indicate cancellation
+            "add-btn": self._submit_form,
+        }
     
     def compose(self) -> ComposeResult:
         """Compose the UI elements for the add book form."""
-        with Container(id="add-book-dialog"):
-            yield Static("Add New Book", classes="dialog-title")
-            
-            with Vertical(classes="dialog-content"):
-                yield Static("", id="error-message", classes="error-text")
-                
-                yield Label("Title:")
-                yield Input(placeholder="Enter book title", id="title-input")
-                
-                yield Label("Author:")
-                yield AutocompleteInput(
-                    suggestions=self.existing_authors,
-                    placeholder="Enter author name",
-                    id="author-input"
-                )
-                
-                yield Label("Book Type:")
-                yield Select(
-                    options=[(book_type.value, book_type) for book_type in BookType],
-                    value=BookType.PHYSICAL,
-                    id="type-select"
-                )
-                
-                yield Label("ISBN (optional):")
-                yield Input(placeholder="Enter ISBN", id="isbn-input")
-                
-                yield Label("Publisher (optional):")
-                yield Input(placeholder="Enter publisher", id="publisher-input")
-                
-                yield Label("Publication Year (optional):")
-                yield Input(placeholder="Enter year", id="year-input")
-                
-                yield Label("Pages (optional):")
-                yield Input(placeholder="Enter page count", id="pages-input")
-                
-                # Additional fields that might require scrolling
-                yield Label("Genre (optional):")
-                yield Input(placeholder="Enter genre", id="genre-input")
-                
-                yield Label("Description (optional):")
-                yield TextArea(placeholder="Enter book description", id="description-input")
-                
-                with Horizontal(classes="dialog-buttons"):
-                    yield Button("Cancel", variant="default", id="cancel-btn")
-                    yield Button("Add Book", variant="primary", id="add-btn")
+        # Keep references to the form widgets so submitting doesn't need
+        # to search the DOM for each field
+        self._error_message = Static("", id="error-message", classes="error-text")
+        self._title_input = Input(placeholder="Enter book title", id="title-input")
+        self._author_input = AutocompleteInput(
+            suggestions=self.existing_authors,
+            placeholder="Enter author name",
+            id="author-input"
+        )
+        self._type_select = Select(
+            options=_BOOK_TYPE_OPTIONS,
+            value=BookType.PHYSICAL,
+            id="type-select"
+        )
+        self._description_input = TextArea(
+            placeholder="Enter book description", id="description-input"
+        )
+        # Single-line fields by form key, read and stripped together on submit
+        self._text_fields = {
+            'title': self._title_input,
+            'author': self._author_input,
+        }
+        self._text_fields.update(
+            (key, Input(placeholder=placeholder, id=f"{key}-input"))
+            for key, _, placeholder in self._OPTIONAL_INPUT_FIELDS
+        )
+        
+        # Build the whole form up front and hand it to the containers in
+        # one go, rather than yielding each widget individually
+        content = [
+            self._error_message,
+            Label("Title:"), self._title_input,
+            Label("Author:"), self._author_input,
+            Label("Book Type:"), self._type_select,
+        ]
+        for key, label, _ in self._OPTIONAL_INPUT_FIELDS:
+            content.append(Label(label))
+            content.append(self._text_fields[key])
+        content += [
+            Label("Description (optional):"), self._description_input,
+            Horizontal(
+                Button("Cancel", variant="default", id="cancel-btn"),
+                Button("Add Book", variant="primary", id="add-btn"),
+                classes="dialog-buttons"
+            ),
+        ]
+        
+        yield Container(
+            Static("Add New Book", classes="dialog-title"),
+            Vertical(*content, classes="dialog-content"),
+            id="add-book-dialog"
+        )
     
     def on_mount(self) -> None:
         """Set up initial focus when modal opens."""
-        self.query_one("#title-input").focus()
+        self._title_input.focus()
     
     def action_submit(self) -> None:
         """Submit the form via keyboard shortcut."""
@@ -98,71 +132,72 @@ class AddBookScreen(ModalScreen):
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses in the dialog."""
-        if event.button.id == "cancel-btn":
-            self.dismiss(None)  # Return None to indicate cancellation
-        elif event.button.id == "add-btn":
-            self._submit_form()
+        handler = self._button_handlers.get(event.button.id)
+        if handler:
+            handler()
     
     def _submit_form(self) -> None:
         """Submit the form with validation."""
         # Clear previous error message
-        self.query_one("#error-message").update("")
+        self._error_message.update("")
         
-        # Collect form data
-        title = self.query_one("#title-input").value.strip()
-        author = self.query_one("#author-input").value.strip()
+        # Collect form data, stripping each field once
+        values = {
+            name: widget.value.strip() for name, widget in self._text_fields.items()
+        }
+        title = values['title']
+        author = values['author']
         
         # Validate required fields
         if not title:
-            self.query_one("#error-message").update("Title is required")
-            self.query_one("#title-input").focus()
+            self._error_message.update("Title is required")
+            self._title_input.focus()
             return
             
         if not author:
-            self.query_one("#error-message").update("Author is required")
-            self.query_one("#author-input").focus()
+            self._error_message.update("Author is required")
+            self._author_input.focus()
             return
         
         # Collect optional fields
-        book_type = self.query_one("#type-select").value
-        isbn = self.query_one("#isbn-input").value.strip() or None
-        publisher = self.query_one("#publisher-input").value.strip() or None
+        book_type = self._type_select.value
+        isbn = values['isbn'] or None
+        publisher = values['publisher'] or None
         
         # Handle numeric fields with error checking
-        year_str = self.query_one("#year-input").value.strip()
-        year = None
-        if year_str:
-            try:
-                year = int(year_str)
-            except ValueError:
-                self.query_one("#error-message").update("Publication year must be a number")
-                self.query_one("#year-input").focus()
-                return
+        year_str = values['year']
+        year = _to_int(year_str) if year_str else None
+        if year_str and year is None:
+            self._error_message.update("Publication year must be a number")
+            self._text_fields['year'].focus()
+            return
         
-        pages_str = self.query_one("#pages-input").value.strip()
-        pages = None
-        if pages_str:
-            try:
-                pages = int(pages_str)
-            except ValueError:
-                self.query_one("#error-message").update("Pages must be a number")
-                self.query_one("#pages-input").focus()
-                return
+        pages_str = values['pages']
+        pages = _to_int(pages_str) if pages_str else None
+        if pages_str and (pages is None or pages <= 0):
+            self._error_message.update("Pages must be a positive number")
+            self._text_fields['pages'].focus()
+            return
         
         # Additional optional fields
-        genre = self.query_one("#genre-input").value.strip() or None
-        description = self.query_one("#description-input").text.strip() or None
+        genre = values['genre'] or None
+        description = self._description_input.text.strip() or None
         
-        # Return the book data
+        # Return the book data, split into the fields stored in the database
+        # ("db", matching DatabaseManager.add_book) and display-only extras
         book_data = {
-            'title': title,
-            'author': author,
-            'book_type': book_type,
-            'isbn': isbn,
-            'publisher': publisher,
-            'publication_year': year,
-            'pages': pages,
-            'genre': genre,
-            'description': description
+            'db': {
+                'title': title,
+                'author': author,
+                'book_type': book_type,
+                'isbn': isbn,
+                'publisher': publisher,
+                'publication_year': year,
+                'pages': pages,
+            },
+            'extra': {
+                'genre': genre,
+                'description': description,
+            },
         }
         self.dismiss(book_data)
\ No newline at end of file
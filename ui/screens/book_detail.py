@@ -2,6 +2,10 @@
 Screen for viewing and managing details of a specific book.
 """
 
+from collections import namedtuple
+
+from textual import work
+from textual.worker import get_current_worker
 from textual.app import ComposeResult
 from textual.containers import Container, ScrollableContainer
 from textual.widgets import Button, Static, ListView, ListItem, Label, Header, Footer
@@ -9,12 +13,49 @@ from textual.screen import Screen
 from textual.binding import Binding
 
 from database import DatabaseManager
-from models import NoteType
+from models import NoteType, BOOK_TYPE_VALUE, READING_STATUS_VALUE, NOTE_TYPE_VALUE
 from utils.date_utils import format_date_for_display
 from .reading_session import ReadingSessionScreen
 from .confirm_delete import ConfirmDeleteScreen
 
 
+# Longest note preview shown in the notes list, including the ellipsis.
+# Must not exceed the NOTE_PREVIEW_CHARS the database returns.
+NOTE_PREVIEW_LENGTH = 100
+
+# Notes mounted at a time; further pages are added on request
+NOTES_PAGE_SIZE = 50
+
+# Most recent sessions listed until the user asks to see them all
+SESSIONS_SHOWN = 20
+
+# Seconds to collect newly added notes before saving them in one batch
+NOTE_SAVE_DELAY = 0.3
+
+# A just-saved note, shaped like the preview rows the database returns
+NewNote = namedtuple("NewNote", "id note_type title preview page_number")
+
+
+def _format_note(note) -> str:
+    """Build the one-line summary shown for a note preview row."""
+    content = note.preview
+    if len(content) > NOTE_PREVIEW_LENGTH:
+        content = content[:NOTE_PREVIEW_LENGTH - 1] + "…"
+    
+    title = f"{note.title}: " if note.title else ""
+    page = f" (p. {note.page_number})" if note.page_number else ""
+    return f"[{NOTE_TYPE_VALUE[note.note_type]}] {title}{content}{page}"
+
+
+def _format_session(session) -> str:
+    """Build the line shown for a reading session in the sessions list."""
+    end = format_date_for_display(session.end_date) if session.end_date else 'ongoing'
+    line = f"• {format_date_for_display(session.start_date)} - {end}"
+    if session.session_notes:
+        line = f"{line}: {session.session_notes}"
+    return line
+
+
 class BookDetailScreen(Screen):
     """
     Screen for viewing and managing details of a specific book.
@@ -32,6 +73,7 @@ class BookDetailScreen(Screen):
         Binding("s", "start_reading", "Start Reading"),
         Binding("e", "end_reading", "End Reading"),
         Binding("d", "delete_book", "Delete Book"),
+        Binding("v", "show_all_sessions", "All Sessions"),
         ]
     
     def __init__(self, book_id: int, db_manager: DatabaseManager):
@@ -39,17 +81,35 @@ class BookDetailScreen(Screen):
         self.book_id = book_id
         self.db_manager = db_manager
         self.book = None
+        self._sessions = []
+        self._notes = []
+        self._notes_shown = 0
+        self._show_all_sessions = False
+        self._pending_notes = []
+        self._note_save_timer = None
+        # Button ID -> handler, so a press is one dict lookup
+        self._button_handlers = {
+            "back-btn": self.action_back,
+            "start-reading-btn": self.action_start_reading,
+            "end-reading-btn": self.action_end_reading,
+            "add-note-btn": self.action_add_note,
+        }
     
     def compose(self) -> ComposeResult:
         """Compose the book detail view."""
+        # Keep references to the widgets updated on every data load
+        self._book_info = Static("", id="book-info")
+        self._sessions_info = Static("", id="sessions-info")
+        self._notes_list = ListView(id="notes-list")
+        
         yield Header()
         
         with ScrollableContainer():
-            yield Static("", id="book-info")
+            yield self._book_info
             yield Static("Reading Sessions", classes="section-title")
-            yield Static("", id="sessions-info")
+            yield self._sessions_info
             yield Static("Notes & Highlights", classes="section-title")
-            yield ListView(id="notes-list")
+            yield self._notes_list
             
         with Container(classes="action-bar"):
             yield Button("Start Reading", id="start-reading-btn")
@@ -63,68 +123,124 @@ class BookDetailScreen(Screen):
         """Load book data when screen is mounted."""
         self.load_book_data()
     
+    @work(exclusive=True, thread=True)
     def load_book_data(self) -> None:
-        """Load and display book information."""
-        self.book = self.db_manager.get_book_by_id(self.book_id)
-        if not self.book:
+        """
+        Load book information in a background thread.
+        
+        The database reads run off the UI thread; the results are handed to
+        _apply_book_data on the UI thread for display. Starting a new load
+        cancels any one still in progress.
+        """
+        details = self.db_manager.get_book_details(self.book_id)
+        if details is None or get_current_worker().is_cancelled:
             return
+        self.app.call_from_thread(self._apply_book_data, *details)
+    
+    @work(exclusive=True, thread=True, group="reading-state")
+    def load_reading_state(self) -> None:
+        """
+        Re-read just the book and its reading sessions in a background thread,
+        after a session was started or ended. Notes are unaffected, so the
+        notes list is left as it is.
+        """
+        book = self.db_manager.get_book_by_id(self.book_id)
+        sessions = self.db_manager.get_reading_sessions(self.book_id)
+        if book is None or get_current_worker().is_cancelled:
+            return
+        self.app.call_from_thread(self._apply_reading_state, book, sessions)
+    
+    def _apply_book_data(self, book, sessions, notes) -> None:
+        """Display loaded book data (runs on the UI thread)."""
+        self._apply_reading_state(book, sessions)
+        
+        # Show the first page of notes
+        self._notes = notes
+        self._notes_shown = 0
+        self._notes_list.clear()
+        self._show_more_notes()
+    
+    def _apply_reading_state(self, book, sessions) -> None:
+        """Display the book information and reading sessions."""
+        self.book = book
         
         # Update book info display
-        info_text = f"""Title: {self.book.title}
-Author: {self.book.author}
-Type: {self.book.book_type.value}
-Status: {self.book.status.value}
-Added: {self.book.added_date.strftime('%Y-%m-%d')}"""
-        
-        if self.book.isbn:
-            info_text += f"\nISBN: {self.book.isbn}"
-        if self.book.publisher:
-            info_text += f"\nPublisher: {self.book.publisher}"
-        if self.book.publication_year:
-            info_text += f"\nYear: {self.book.publication_year}"
-        if self.book.pages:
-            info_text += f"\nPages: {self.book.pages}"
-        
-        self.query_one("#book-info").update(info_text)
-        
-        # Load reading sessions
-        sessions = self.db_manager.get_reading_sessions(self.book_id)
-        if sessions:
-            sessions_text = "\n".join([
-                f"• {format_date_for_display(session.start_date)} - "
-                f"{format_date_for_display(session.end_date) if session.end_date else 'ongoing'}"
-                + (f": {session.session_notes}" if session.session_notes else "")
-                for session in sessions
-            ])
-        else:
-            sessions_text = "No reading sessions yet."
-        self.query_one("#sessions-info").update(sessions_text)
-        
-        # Load notes
-        notes = self.db_manager.get_notes_for_book(self.book_id)
-        notes_list = self.query_one("#notes-list")
-        notes_list.clear()
-        
-        for note in notes:
-            note_text = f"[{note.note_type.value}] "
-            if note.title:
-                note_text += f"{note.title}: "
-            note_text += note.content[:100] + ("..." if len(note.content) > 100 else "")
-            if note.page_number:
-                note_text += f" (p. {note.page_number})"
-            
-            notes_list.append(ListItem(Label(note_text)))
+        info_lines = [
+            f"Title: {book.title}",
+            f"Author: {book.author}",
+            f"Type: {BOOK_TYPE_VALUE[book.book_type]}",
+            f"Status: {READING_STATUS_VALUE[book.status]}",
+            f"Added: {book.added_date.date().isoformat()}",
+        ]
+        if book.isbn:
+            info_lines.append(f"ISBN: {book.isbn}")
+        if book.publisher:
+            info_lines.append(f"Publisher: {book.publisher}")
+        if book.publication_year:
+            info_lines.append(f"Year: {book.publication_year}")
+        if book.pages:
+            info_lines.append(f"Pages: {book.pages}")
+        
+        self._book_info.update("\n".join(info_lines))
+        
+        self._sessions = sessions
+        self._render_sessions()
+    
+    def _render_sessions(self) -> None:
+        """
+        Show the reading sessions, limited to the most recent SESSIONS_SHOWN
+        unless the user asked for all of them.
+        """
+        sessions = self._sessions
+        if not sessions:
+            self._sessions_info.update("No reading sessions yet.")
+            return
+        
+        shown = sessions if self._show_all_sessions else sessions[:SESSIONS_SHOWN]
+        sessions_text = "\n".join(map(_format_session, shown))
+        
+        hidden = len(sessions) - len(shown)
+        if hidden:
+            sessions_text += f"\n… and {hidden} earlier (press 'v' to show all)"
+        self._sessions_info.update(sessions_text)
+    
+    def _show_more_notes(self) -> None:
+        """
+        Mount the next NOTES_PAGE_SIZE notes, followed by a "show more" item
+        if any remain, so long note lists don't build every widget up front.
+        """
+        notes_list = self._notes_list
+        start = self._notes_shown
+        end = start + NOTES_PAGE_SIZE
+        
+        # Build every item first and mount them in a single batch
+        items = [ListItem(Label(_format_note(note))) for note in self._notes[start:end]]
+        self._notes_shown = min(end, len(self._notes))
+        
+        remaining = len(self._notes) - self._notes_shown
+        if remaining:
+            items.append(ListItem(
+                Label(f"… {remaining} more notes (select to show more)"),
+                classes="more-notes"
+            ))
+        notes_list.extend(items)
+    
+    def on_list_view_selected(self, event: ListView.Selected) -> None:
+        """Load the next page of notes when the "show more" item is selected."""
+        if event.item.has_class("more-notes"):
+            event.item.remove()
+            self._show_more_notes()
+    
+    def action_show_all_sessions(self) -> None:
+        """List every reading session, not just the most recent ones."""
+        self._show_all_sessions = True
+        self._render_sessions()
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
-        if event.button.id == "back-btn":
-            self.action_back()
-        elif event.button.id == "start-reading-btn":
-            self.action_start_reading()
-        elif event.button.id == "end-reading-btn":
-            self.action_end_reading()
-        elif event.button.id == "add-note-btn":
-            self.action_add_note()
+        handler = self._button_handlers.get(event.button.id)
+        if handler:
+            handler()
     
     def action_back(self) -> None:
         """Go back to the main screen."""
@@ -132,21 +248,13 @@ Added: {self.book.added_date.strftime('%Y-%m-%d')}"""
     
     def action_start_reading(self) -> None:
         """Start a reading session for this book."""
+        if self.book is None:  # Still loading
+            return
+        
         def handle_session_result(session_data):
             """Handle the result from the reading session dialog."""
             if session_data:  # User didn't cancel
-                try:
-                    self.db_manager.start_reading_session(
-                        self.book_id, 
-                        session_data['date_str']
-                    )
-                    self.load_book_data()  # Refresh the display
-                except ValueError as e:
-                    # Date parsing error
-                    self.bell()
-                except Exception as e:
-                    # Other error
-                    self.bell()
+                self.start_session(session_data['date_str'])
         
         # Show the reading session dialog
         session_screen = ReadingSessionScreen(
@@ -158,23 +266,17 @@ Added: {self.book.added_date.strftime('%Y-%m-%d')}"""
     
     def action_end_reading(self) -> None:
         """End the current reading session."""
+        if self.book is None:  # Still loading
+            return
+        
         def handle_session_result(session_data):
             """Handle the result from the reading session dialog."""
             if session_data:  # User didn't cancel
-                try:
-                    self.db_manager.end_reading_session(
-                        self.book_id,
-                        session_data['date_str'],
-                        session_data.get('notes'),
-                        session_data.get('completed', False)
-                    )
-                    self.load_book_data()  # Refresh the display
-                except ValueError as e:
-                    # Date parsing error
-                    self.bell()
-                except Exception as e:
-                    # Other error
-                    self.bell()
+                self.end_session(
+                    session_data['date_str'],
+                    session_data.get('notes'),
+                    session_data.get('completed', False)
+                )
         
         # Show the reading session dialog
         session_screen = ReadingSessionScreen(
@@ -184,38 +286,140 @@ Added: {self.book.added_date.strftime('%Y-%m-%d')}"""
         )
         self.app.push_screen(session_screen, handle_session_result)
     
+    # Database writes run on the database manager's writer thread; these
+    # async workers await them so the UI stays responsive meanwhile
+    
+    @work(group="db-write")
+    async def start_session(self, date_str: str) -> None:
+        """Start a reading session, then refresh the display."""
+        try:
+            await self.db_manager.run_write(
+                self.db_manager.start_reading_session, self.book_id, date_str
+            )
+        except ValueError as e:
+            # Date parsing error
+            self.bell()
+            return
+        except Exception as e:
+            # Other error
+            self.bell()
+            return
+        self._reading_changed()
+    
+    @work(group="db-write")
+    async def end_session(self, date_str: str, notes: str = None,
+                          completed: bool = False) -> None:
+        """End the current reading session, then refresh the display."""
+        try:
+            await self.db_manager.run_write(
+                self.db_manager.end_reading_session,
+                self.book_id, date_str, notes, completed
+            )
+        except ValueError as e:
+            # Date parsing error
+            self.bell()
+            return
+        except Exception as e:
+            # Other error
+            self.bell()
+            return
+        self._reading_changed()
+    
+    def _reading_changed(self) -> None:
+        """Show the effects of a started or ended reading session."""
+        self.load_reading_state()  # Refresh book info and sessions
+        self.app.request_books_refresh()  # Status shown in main table
+    
     def action_add_note(self) -> None:
-        """Add a note to this book."""
+        """
+        Add a note to this book.
+        
+        Notes added in quick succession are saved together after
+        NOTE_SAVE_DELAY, in one transaction.
+        """
         # In a real implementation, you'd show a modal dialog for adding notes
         # For now, just add a sample note
-        self.db_manager.add_note(
-            self.book_id, 
-            NoteType.THOUGHT, 
-            "Sample thought added from UI",
-            title="UI Test Note"
-        )
-        self.load_book_data()  # Refresh the display
+        self._pending_notes.append({
+            'book_id': self.book_id,
+            'note_type': NoteType.THOUGHT,
+            'content': "Sample thought added from UI",
+            'title': "UI Test Note",
+            'page_number': None,
+        })
+        if self._note_save_timer is None:
+            self._note_save_timer = self.set_timer(NOTE_SAVE_DELAY, self._save_pending_notes)
+    
+    def _save_pending_notes(self) -> None:
+        """Hand the notes collected so far to save_notes."""
+        self._note_save_timer = None
+        rows, self._pending_notes = self._pending_notes, []
+        if rows:
+            self.save_notes(rows)
+    
+    @work(group="db-write")
+    async def save_notes(self, rows: list) -> None:
+        """
+        Save a batch of notes and add them to the top of the notes list,
+        without reloading the rest of the screen.
+        """
+        try:
+            ids = await self.db_manager.run_write(self.db_manager.add_notes_bulk, rows)
+        except Exception as e:
+            self.bell()
+            return
+        
+        # Newest first, matching the order notes are listed in
+        new_notes = [
+            NewNote(note_id, row['note_type'], row['title'], row['content'], row['page_number'])
+            for note_id, row in zip(reversed(ids), reversed(rows))
+        ]
+        self._notes = new_notes + list(self._notes)
+        self._notes_shown += len(new_notes)
+        self._notes_list.insert(0, [ListItem(Label(_format_note(note))) for note in new_notes])
+        self._notes_list.scroll_home()  # Bring the new notes into view
+    
+    def on_unmount(self) -> None:
+        """
+        Save any notes still waiting for their batch when leaving.
+        
+        Batches already handed to save_notes are safe too: its worker is
+        cancelled with the screen, but run_write still completes the write.
+        """
+        if self._pending_notes:
+            self.db_manager.submit_write(self.db_manager.add_notes_bulk, self._pending_notes)
+            self._pending_notes = []
 
     def action_delete_book(self) -> None:
         """Delete the current book with confirmation."""
         def handle_confirmation(confirmed: bool):
             """Handle the result from the confirmation dialog."""
             if confirmed:  # User confirmed deletion
-                try:
-                    success = self.db_manager.delete_book(self.book_id)
-                    if success:
-                        # Go back to main screen after successful deletion
-                        self.app.pop_screen()
-                    else:
-                        # In a real app, show error message
-                        self.bell()  # Make error sound
-                except Exception as e:
-                    # Handle any database errors
-                    self.bell()
+                self.delete_book()
     
         # Show confirmation dialog
         confirm_screen = ConfirmDeleteScreen(
             "Are you sure you want to delete this book?",
             self.book.title if self.book else "Unknown"
         )
-        self.app.push_screen(confirm_screen, handle_confirmation)
\ No newline at end of file
+        self.app.push_screen(confirm_screen, handle_confirmation)
+    
+    @work(group="db-write")
+    async def delete_book(self) -> None:
+        """Delete this book and return to the main screen."""
+        try:
+            success = await self.db_manager.run_write(
+                self.db_manager.delete_book, self.book_id
+            )
+        except Exception as e:
+            # Handle any database errors
+            self.bell()
+            return
+        
+        if success:
+            # Go back to main screen after successful deletion
+            self.app.request_books_refresh()
+            self.app.prefetch_authors()
+            self.app.pop_screen()
+        else:
+            # In a real app, show error message
+            self.bell()  # Make error sound
\ No newline at end of file
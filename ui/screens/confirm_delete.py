@@ -11,6 +11,12 @@ from textual.screen import ModalScreen
 class ConfirmDeleteScreen(ModalScreen):
     """Simple confirmation dialog for dangerous actions."""
     
+    # Button ID -> result the dialog is dismissed with
+    _BUTTON_RESULTS = {
+        "cancel-btn": False,  # User cancelled
+        "delete-btn": True,   # User confirmed deletion
+    }
+    
     def __init__(self, message: str, book_title: str):
         super().__init__()
         self.message = message
@@ -29,7 +35,6 @@ class ConfirmDeleteScreen(ModalScreen):
                     yield Button("Delete", variant="error", id="delete-btn")
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "cancel-btn":
-            self.dismiss(False)  # User cancelled
-        elif event.button.id == "delete-btn":
-            self.dismiss(True)   # User confirmed deletion
\ No newline at end of file
+        result = self._BUTTON_RESULTS.get(event.button.id)
+        if result is not None:
+            self.dismiss(result)
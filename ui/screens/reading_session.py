@@ -23,6 +23,9 @@ class ReadingSessionScreen(ModalScreen):
     - And many more natural language formats!
     """
     
+    # Seconds to wait after the last keystroke before re-parsing the date
+    PREVIEW_DEBOUNCE_DELAY = 0.15
+    
     def __init__(self, book_id: int, book_title: str, action: str = "start"):
         """
         Initialize the reading session screen.
@@ -36,33 +39,45 @@ class ReadingSessionScreen(ModalScreen):
         self.book_id = book_id
         self.book_title = book_title
         self.action = action
+        self._preview_timer = None
+        # Button ID -> handler, so a press is one dict lookup
+        self._button_handlers = {
+            "cancel-btn": self._cancel,
+            "action-btn": self._submit_session,
+        }
     
     def compose(self) -> ComposeResult:
         """Compose the reading session form."""
         title = f"{'Start' if self.action == 'start' else 'End'} Reading Session"
         
+        # Keep references to the widgets read on every keystroke/submit
+        self._date_input = Input(
+            placeholder="Enter date (e.g., 'today', '2023-12-25', 'Dec 25', 'yesterday')",
+            id="date-input",
+            value="today"  # Default to today
+        )
+        self._date_preview = Static("", id="date-preview", classes="date-preview")
+        self._completed_checkbox = Checkbox("Book completed", id="completed-checkbox")
+        self._notes_input = TextArea(
+            placeholder="Enter notes about this reading session...",
+            id="notes-input"
+        )
+        
         with Container(id="session-dialog"):
             yield Static(title, classes="dialog-title")
             with ScrollableContainer(classes="dialog-content"):
                 yield Static(f"Book: {self.book_title}", classes="book-info")
                 
                 yield Label(f"{'Start' if self.action == 'start' else 'End'} Date:")
-                yield Input(
-                    placeholder="Enter date (e.g., 'today', '2023-12-25', 'Dec 25', 'yesterday')",
-                    id="date-input",
-                    value="today"  # Default to today
-                )
-                yield Static("", id="date-preview", classes="date-preview")
+                yield self._date_input
+                yield self._date_preview
                 
                 if self.action == "end":
                     yield Label("Mark as completed?")
-                    yield Checkbox("Book completed", id="completed-checkbox")
+                    yield self._completed_checkbox
                 
                 yield Label("Session Notes (optional):")
-                yield TextArea(
-                    placeholder="Enter notes about this reading session...",
-                    id="notes-input"
-                )
+                yield self._notes_input
                 
                 with Horizontal(classes="dialog-buttons"):
                     yield Button("Cancel", variant="default", id="cancel-btn")
@@ -74,51 +89,71 @@ class ReadingSessionScreen(ModalScreen):
     
     @on(Input.Changed, "#date-input")
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Update date preview as user types."""
+        """Schedule a date preview update once the user pauses typing."""
+        if self._preview_timer is not None:
+            self._preview_timer.stop()
+        
         date_str = event.value.strip()
-        preview = self.query_one("#date-preview")
+        self._preview_timer = self.set_timer(
+            self.PREVIEW_DEBOUNCE_DELAY,
+            lambda: self._update_preview(date_str)
+        )
+    
+    def _update_preview(self, date_str: str) -> None:
+        """Parse the entered date and show the result below the input."""
+        self._preview_timer = None
+        preview = self._date_preview
         
         if not date_str:
             preview.update("")
             return
             
         parsed_date = parse_date_input(date_str)
-        if parsed_date:
+        valid = parsed_date is not None
+        if valid:
             formatted = format_date_for_display(parsed_date)
             preview.update(f"✓ Parsed as: {formatted}")
-            preview.set_class(True, "valid-date")
-            preview.set_class(False, "invalid-date")
         else:
             preview.update(f"✗ Could not parse: {date_str}")
-            preview.set_class(False, "valid-date")
-            preview.set_class(True, "invalid-date")
+        
+        # Swap the classes with a single style update rather than one each
+        preview.set_class(not valid, "invalid-date", update=False)
+        preview.set_class(valid, "valid-date", update=False)
+        preview.update_node_styles()
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
-        if event.button.id == "cancel-btn":
-            self.dismiss(None)
-        elif event.button.id == "action-btn":
-            # Validate and collect form data
-            date_str = self.query_one("#date-input").value.strip()
-            notes = self.query_one("#notes-input").text.strip() or None
-            
-            if not date_str:
-                # Show error - in a real app, you'd have proper error handling
-                return
-            
-            # Validate date can be parsed
-            if not validate_date_input(date_str):
-                # Show error - date couldn't be parsed
-                return
-            
-            session_data = {
-                'date_str': date_str,
-                'notes': notes,
-                'action': self.action
-            }
-            
-            if self.action == "end":
-                completed = self.query_one("#completed-checkbox").value
-                session_data['completed'] = completed
-            
-            self.dismiss(session_data)
\ No newline at end of file
+        handler = self._button_handlers.get(event.button.id)
+        if handler:
+            handler()
+    
+    def _cancel(self) -> None:
+        """Close the dialog without starting or ending a session."""
+        self.dismiss(None)
+    
+    def _submit_session(self) -> None:
+        """Validate the form and return the session data."""
+        # Validate and collect form data
+        date_str = self._date_input.value.strip()
+        notes = self._notes_input.text.strip() or None
+        
+        if not date_str:
+            # Show error - in a real app, you'd have proper error handling
+            return
+        
+        # Validate date can be parsed
+        if not validate_date_input(date_str):
+            # Show error - date couldn't be parsed
+            return
+        
+        session_data = {
+            'date_str': date_str,
+            'notes': notes,
+            'action': self.action
+        }
+        
+        if self.action == "end":
+            completed = self._completed_checkbox.value
+            session_data['completed'] = completed
+        
+        self.dismiss(session_data)
\ No newline at end of file
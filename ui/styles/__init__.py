@@ -2,6 +2,9 @@
 Styling for the book library application.
 """
 
-from .app_styles import APP_CSS
+from pathlib import Path
 
-__all__ = ['APP_CSS']
\ No newline at end of file
+# Stylesheet for the whole application, loaded by Textual via CSS_PATH
+APP_CSS_PATH = Path(__file__).parent / "app_styles.tcss"
+
+__all__ = ['APP_CSS_PATH']
@@ -3,5 +3,6 @@ Custom widgets for the book library application.
 """
 
 from .autocomplete_input import AutocompleteInput
+from .suggestion_index import SuggestionIndex, get_suggestion_index
 
-__all__ = ['AutocompleteInput']
\ No newline at end of file
+__all__ = ['AutocompleteInput', 'SuggestionIndex', 'get_suggestion_index']
\ No newline at end of file
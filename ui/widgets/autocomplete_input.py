@@ -5,11 +5,13 @@ Autocomplete input widget for the book library application.
 from typing import List
 from textual.app import ComposeResult
 from textual.widgets import Input, ListView, ListItem, Label
-from textual.containers import Container, Vertical
+from textual.containers import Vertical
 from textual.binding import Binding
 from textual.message import Message
 from textual import on
 
+from .suggestion_index import get_suggestion_index
+
 
 class AutocompleteInput(Vertical):
     """
@@ -45,17 +47,25 @@ class AutocompleteInput(Vertical):
         display: block;
     }
     
-    AutocompleteInput ListView > ListItem {
+    /* Suggestion items are styled through a class rather than type and
+       child selectors (scoped to this widget like the rules above) */
+    .suggestion-item {
         height: 1;
         padding: 0 1;
     }
     
-    AutocompleteInput ListView > ListItem:focus {
+    .suggestion-item:focus {
         background: $primary;
         color: $text;
     }
     """
     
+    # Most suggestions shown in the dropdown at once
+    MAX_SUGGESTIONS = 10
+    
+    # Seconds to wait after the last keystroke before filtering suggestions
+    FILTER_DEBOUNCE_DELAY = 0.05
+    
     BINDINGS = [
         Binding("down", "select_next", "Next suggestion", show=False),
         Binding("up", "select_previous", "Previous suggestion", show=False),
@@ -90,37 +100,52 @@ class AutocompleteInput(Vertical):
         """
         super().__init__(id=id, classes=classes)
         self.all_suggestions = suggestions
+        self._index = get_suggestion_index(suggestions)
         self.filtered_suggestions = []
         self.placeholder = placeholder
         self.initial_value = value
         self.suggestions_visible = False
+        self._filter_timer = None
+        # Suggestions currently held by the list view, in order
+        self._rendered_suggestions: List[str] = []
     
     def compose(self) -> ComposeResult:
         """Compose the autocomplete input widget."""
-        yield Input(
+        # Keep references to the child widgets used by every handler
+        self._input = Input(
             placeholder=self.placeholder,
             value=self.initial_value,
             id="input"
         )
-        yield ListView(id="suggestions")
+        self._suggestions_list = ListView(id="suggestions")
+        yield self._input
+        yield self._suggestions_list
     
     # Widget is focusable as a single unit
     can_focus = True
     
     @on(Input.Changed, "#input")
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Handle input text changes."""
+        """Schedule filtering once the user pauses typing."""
         query = event.value.strip().lower()
         
         if not query:
             self.hide_suggestions()
             return
         
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(
+            self.FILTER_DEBOUNCE_DELAY,
+            lambda: self._filter_suggestions(query)
+        )
+    
+    def _filter_suggestions(self, query: str) -> None:
+        """Show the suggestions matching the query."""
+        self._filter_timer = None
+        
         # Filter suggestions based on input
-        self.filtered_suggestions = [
-            suggestion for suggestion in self.all_suggestions
-            if query in suggestion.lower()
-        ]
+        self.filtered_suggestions = self._index.search(query, self.MAX_SUGGESTIONS)
         
         if self.filtered_suggestions:
             self.show_suggestions()
@@ -135,19 +160,38 @@ class AutocompleteInput(Vertical):
     
     def show_suggestions(self) -> None:
         """Show the suggestions list."""
-        suggestions_list = self.query_one("#suggestions", ListView)
-        suggestions_list.clear()
+        suggestions_list = self._suggestions_list
+        rendered = self._rendered_suggestions
+        new = self.filtered_suggestions
+        
+        # Keep the items shared with what's already shown at the top (the
+        # usual case while narrowing a query) and only replace the rest
+        common = 0
+        for old_suggestion, new_suggestion in zip(rendered, new):
+            if old_suggestion != new_suggestion:
+                break
+            common += 1
         
-        for suggestion in self.filtered_suggestions[:10]:  # Limit to 10 suggestions
-            suggestions_list.append(ListItem(Label(suggestion)))
+        if common < len(rendered):
+            suggestions_list.remove_items(range(common, len(rendered)))
+        # Mount the new items in one call rather than one append each
+        if common < len(new):
+            suggestions_list.extend(
+                ListItem(Label(suggestion), classes="suggestion-item")
+                for suggestion in new[common:]
+            )
+        self._rendered_suggestions = list(new)
         
         suggestions_list.add_class("visible")
         self.suggestions_visible = True
     
     def hide_suggestions(self) -> None:
         """Hide the suggestions list."""
-        suggestions_list = self.query_one("#suggestions", ListView)
-        suggestions_list.remove_class("visible")
+        # Also drop a pending filter, so it can't reopen the list afterwards
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+            self._filter_timer = None
+        self._suggestions_list.remove_class("visible")
         self.suggestions_visible = False
     
     @on(ListView.Selected, "#suggestions")
@@ -159,7 +203,7 @@ class AutocompleteInput(Vertical):
             selected_text = label.renderable
             
             # Update the input with the selected text
-            input_widget = self.query_one("#input", Input)
+            input_widget = self._input
             input_widget.value = selected_text
             
             # Hide suggestions and focus input
@@ -169,46 +213,43 @@ class AutocompleteInput(Vertical):
     def action_select_next(self) -> None:
         """Select the next suggestion."""
         if self.suggestions_visible:
-            suggestions_list = self.query_one("#suggestions", ListView)
-            suggestions_list.action_cursor_down()
+            self._suggestions_list.action_cursor_down()
     
     def action_select_previous(self) -> None:
         """Select the previous suggestion."""
         if self.suggestions_visible:
-            suggestions_list = self.query_one("#suggestions", ListView)
-            suggestions_list.action_cursor_up()
+            self._suggestions_list.action_cursor_up()
     
     def action_confirm_selection(self) -> None:
         """Confirm the current selection."""
         if self.suggestions_visible:
-            suggestions_list = self.query_one("#suggestions", ListView)
+            suggestions_list = self._suggestions_list
             if suggestions_list.highlighted_child:
                 # Trigger selection
                 suggestions_list.action_select_cursor()
                 return
         
         # If no suggestion selected, submit the current input
-        input_widget = self.query_one("#input", Input)
-        self.post_message(self.Submitted(input_widget.value))
+        self.post_message(self.Submitted(self._input.value))
     
     def action_hide_suggestions(self) -> None:
         """Hide suggestions and return focus to input."""
         self.hide_suggestions()
-        self.query_one("#input").focus()
+        self._input.focus()
     
     @property
     def value(self) -> str:
         """Get the current input value."""
-        return self.query_one("#input", Input).value
+        return self._input.value
     
     @value.setter
     def value(self, new_value: str) -> None:
         """Set the input value."""
-        self.query_one("#input", Input).value = new_value
+        self._input.value = new_value
     
     def focus(self) -> None:
         """Focus the input field."""
-        input_widget = self.query_one("#input", Input)
+        input_widget = self._input
         if input_widget.can_focus:
             input_widget.focus()
             return True
@@ -0,0 +1,188 @@
+"""
+Search index over autocomplete suggestions.
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import List, Sequence
+
+# Start of each word: a word character not preceded by another one
+_WORD_START = re.compile(r"\b\w")
+
+# Maximum number of search results remembered per index
+SEARCH_CACHE_SIZE = 256
+
+# Separates suggestions in the substring-search haystack; never typed
+_SEPARATOR = "\x00"
+
+# Number of distinct suggestion lists whose index is kept for reuse
+SHARED_INDEX_CACHE_SIZE = 4
+
+# tuple(suggestions) -> index, least recently used first
+_shared_indexes: "OrderedDict[tuple, SuggestionIndex]" = OrderedDict()
+
+
+class SuggestionIndex:
+    """
+    Case-insensitive lookup of the suggestions that contain a query.
+
+    The text from every word start of every suggestion is kept in one sorted
+    list, so a query matching the beginning of a word ("her" in "Frank
+    Herbert") is found with a binary search rather than a scan. Only when
+    those matches don't fill the requested number of results are the
+    remaining suggestions scanned for the query anywhere inside them
+    ("erbe"), stopping as soon as enough are found. That scan runs as
+    str.find over all suggestions joined into one string, so it happens in
+    C rather than as a Python loop.
+
+    Results are memoized per query. When the query minus its last character
+    is cached with fewer results than the limit, that list holds every
+    suggestion that can still match, so it is narrowed instead of searching
+    again - typing one more character never rescans the full list.
+    """
+
+    def __init__(self, suggestions: List[str]):
+        """
+        Build the index.
+
+        Args:
+            suggestions: The strings to search, in their preferred display order
+        """
+        self.suggestions = list(suggestions)
+        self._lowered = [suggestion.lower() for suggestion in self.suggestions]
+        # Offsets of each suggestion's word starts (always including 0)
+        self._word_starts = [
+            sorted({0, *(match.start() for match in _WORD_START.finditer(lowered))})
+            for lowered in self._lowered
+        ]
+
+        entries = sorted(
+            (lowered[start:], position)
+            for position, lowered in enumerate(self._lowered)
+            for start in self._word_starts[position]
+        )
+        # Parallel lists: bisect works on plain strings, positions map back
+        self._keys = [key for key, _ in entries]
+        self._positions = [position for _, position in entries]
+
+        # All suggestions in one string for substring scans, with the
+        # offset each suggestion starts at
+        self._haystack = _SEPARATOR.join(self._lowered)
+        self._starts = []
+        offset = 0
+        for lowered in self._lowered:
+            self._starts.append(offset)
+            offset += len(lowered) + 1
+
+        # (query, limit) -> matching positions, least recently used first
+        self._cache: "OrderedDict[tuple, List[int]]" = OrderedDict()
+
+    def search(self, query: str, limit: int) -> List[str]:
+        """
+        Find suggestions containing a query.
+
+        Args:
+            query: Lowercase text to look for
+            limit: Maximum number of results
+
+        Returns:
+            Up to `limit` suggestions; those with a word starting with the
+            query come first
+        """
+        key = (query, limit)
+        positions = self._cache.get(key)
+        if positions is not None:
+            self._cache.move_to_end(key)
+        else:
+            previous = self._cache.get((query[:-1], limit))
+            if previous is not None and len(previous) < limit:
+                positions = self._rank(query, previous)
+            else:
+                positions = self._search_all(query, limit)
+            self._cache[key] = positions
+            if len(self._cache) > SEARCH_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+        return [self.suggestions[position] for position in positions]
+
+    def _search_all(self, query: str, limit: int) -> List[int]:
+        """Search the whole index, returning matching positions."""
+        keys = self._keys
+        found = []
+        seen = set()
+
+        index = bisect_left(keys, query)
+        while index < len(keys) and len(found) < limit and keys[index].startswith(query):
+            position = self._positions[index]
+            if position not in seen:
+                seen.add(position)
+                found.append(position)
+            index += 1
+
+        # Fall back to matches anywhere, in suggestion order
+        haystack = self._haystack
+        starts = self._starts
+        hit = haystack.find(query) if len(found) < limit else -1
+        while hit != -1:
+            position = bisect_right(starts, hit) - 1
+            if position not in seen:
+                found.append(position)
+                if len(found) == limit:
+                    break
+            # Continue from the next suggestion; further hits in this one
+            # add nothing
+            if position + 1 == len(starts):
+                break
+            hit = haystack.find(query, starts[position + 1])
+
+        return found
+
+    def _rank(self, query: str, candidates: List[int]) -> List[int]:
+        """
+        Order the candidates that contain the query the way _search_all
+        would: word-start matches by their matching key, then the rest in
+        suggestion order.
+        """
+        word_matches = []
+        other_matches = []
+        for position in candidates:
+            lowered = self._lowered[position]
+            if query not in lowered:
+                continue
+            keys = [
+                lowered[start:] for start in self._word_starts[position]
+                if lowered.startswith(query, start)
+            ]
+            if keys:
+                word_matches.append((min(keys), position))
+            else:
+                other_matches.append(position)
+        return [position for _, position in sorted(word_matches)] + sorted(other_matches)
+
+
+def get_suggestion_index(suggestions: Sequence[str]) -> SuggestionIndex:
+    """
+    Get an index over the suggestions, reusing one built for an equal list.
+
+    Dialogs are typically opened again and again with the same suggestions
+    (e.g. the cached author list), so they share one index - and its search
+    cache - instead of each building their own.
+
+    Args:
+        suggestions: The strings to search, in their preferred display order
+
+    Returns:
+        The SuggestionIndex for those suggestions
+    """
+    key = tuple(suggestions)
+    index = _shared_indexes.get(key)
+    if index is not None:
+        _shared_indexes.move_to_end(key)
+        return index
+
+    index = SuggestionIndex(key)
+    _shared_indexes[key] = index
+    if len(_shared_indexes) > SHARED_INDEX_CACHE_SIZE:
+        _shared_indexes.popitem(last=False)
+    return index
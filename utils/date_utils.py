@@ -2,10 +2,75 @@
 Date parsing and formatting utilities for the book library application.
 """
 
-from datetime import date
+import re
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from typing import Optional
-from dateutil.parser import parse as parse_date
-from dateutil.parser import ParserError
+
+# Relative words dateutil doesn't understand, as day offsets from today.
+# These are resolved on every call since their meaning changes daily.
+_RELATIVE_DAYS = {"today": 0, "yesterday": -1, "tomorrow": 1}
+
+# A letter or digit; dateutil can't parse a string without one
+_DATE_CHARACTER = re.compile(r"[^\W_]")
+
+# Weekday abbreviations by date.weekday(), as strftime's %a gives them in
+# the C locale
+_WEEKDAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+def _parse_numeric_date(date_string: str) -> Optional[date]:
+    """
+    Parse "YYYY-MM-DD" or "MM/DD/YYYY" directly, without dateutil.
+    
+    Returns None for anything else, including impossible dates like
+    "02/30/2024" or day-first "25/12/2023", which are left to dateutil so
+    they're handled exactly as before.
+    """
+    if len(date_string) != 10:
+        return None
+    if (date_string[4] == '-' and date_string[7] == '-'
+            and date_string.replace('-', '').isdigit()):
+        try:
+            return date.fromisoformat(date_string)
+        except ValueError:
+            return None
+    if date_string[2] == '/' and date_string[5] == '/':
+        month, day, year = date_string[:2], date_string[3:5], date_string[6:]
+        if month.isdigit() and day.isdigit() and year.isdigit():
+            try:
+                return date(int(year), int(month), int(day))
+            except ValueError:
+                return None
+    return None
+
+
+@lru_cache(maxsize=512)
+def _parse_date_cached(date_string: str, today_ordinal: int) -> Optional[date]:
+    """
+    Parse an already-stripped date string with dateutil, memoizing the result.
+    
+    dateutil fills in missing parts ("Dec 25", "monday") from a default
+    date. That default is built from today's ordinal, which is part of the
+    cache key, so each result depends only on its key and entries from
+    previous days simply stop being hit.
+    """
+    # Imported on first use rather than at startup; later calls just hit
+    # the module cache
+    from dateutil.parser import parse as parse_date
+    from dateutil.parser import ParserError
+    
+    # Same midnight-today default dateutil would otherwise compute from the
+    # clock on every call
+    default = datetime.combine(date.fromordinal(today_ordinal), time())
+    
+    try:
+        # dateutil.parser.parse is very flexible
+        parsed_datetime = parse_date(date_string, default=default)
+        # Convert datetime to date (we only need the date part)
+        return parsed_datetime.date()
+    except (ParserError, ValueError, TypeError):
+        return None
 
 
 def parse_date_input(date_string: str) -> Optional[date]:
@@ -38,19 +103,32 @@ def parse_date_input(date_string: str) -> Optional[date]:
     if not date_string or not date_string.strip():
         return None
     
-    try:
-        # dateutil.parser.parse is very flexible
-        parsed_datetime = parse_date(date_string.strip())
-        # Convert datetime to date (we only need the date part)
-        return parsed_datetime.date()
-    except (ParserError, ValueError, TypeError):
+    date_string = date_string.strip()
+    offset = _RELATIVE_DAYS.get(date_string.lower())
+    if offset is not None:
+        return date.today() + timedelta(days=offset)
+    
+    # Plain numeric dates (including our own display format) don't need
+    # dateutil's general parser
+    parsed = _parse_numeric_date(date_string)
+    if parsed is not None:
+        return parsed
+    
+    # Skip dateutil (and its exception) for input that can't be a date,
+    # such as a lone separator typed on the way to "12/25"
+    if not _DATE_CHARACTER.search(date_string):
         return None
+    
+    return _parse_date_cached(date_string, date.today().toordinal())
 
 
+@lru_cache(maxsize=1024)
 def format_date_for_display(date_obj: date) -> str:
     """
     Format a date object for display in the UI.
     
+    Memoized: session lists format the same few dates over and over.
+    
     Args:
         date_obj: The date to format
         
@@ -59,7 +137,12 @@ def format_date_for_display(date_obj: date) -> str:
     """
     if not date_obj:
         return ""
-    return date_obj.strftime("%Y-%m-%d (%a)")  # e.g., "2023-12-25 (Mon)"
+    # e.g., "2023-12-25 (Mon)"; built directly rather than via strftime's
+    # format-string parsing
+    return (
+        f"{date_obj.year:04d}-{date_obj.month:02d}-{date_obj.day:02d} "
+        f"({_WEEKDAY_NAMES[date_obj.weekday()]})"
+    )
 
 
 def validate_date_input(date_string: str) -> bool: